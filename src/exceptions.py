@@ -4,6 +4,12 @@ class InvalidTagCreation(Exception):
     This exception is used to prevent the creation of tags that would violate
     the versioning rules enforced by the VersionControlManager class.
     """
+    __slots__ = ()
+
     def __init__(self, message="Do not try to create an INVALID TAG!"):
-        self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(message)
+
+    @property
+    def message(self):
+        """str: The error message, as stored in ``args[0]``."""
+        return self.args[0]
\ No newline at end of file
@@ -1,6 +1,112 @@
 from git import Repo
-from .exceptions import *
-import re, semver, os
+from git.exc import InvalidGitRepositoryError, NoSuchPathError
+from .exceptions import InvalidTagCreation
+from functools import lru_cache
+import re, os, sys, tempfile
+
+
+@lru_cache(maxsize=64)
+def _compile(pattern):
+    """Compile a regex pattern, keeping hold of the compiled object.
+
+    ``re.compile`` hands already compiled patterns back unchanged, so this
+    accepts either a pattern string or an ``re.Pattern``.
+    """
+    return re.compile(pattern)
+
+
+def _is_number(s: str):
+    """Check that a version field is a plain decimal number without leading zeros."""
+    return s.isascii() and s.isdigit() and (s == "0" or not s.startswith("0"))
+
+
+def _is_prod(tag: str):
+    """Check whether a tag is a production version in the format "X.Y.Z"."""
+    parts = tag.split(".")
+    return len(parts) == 3 and all(_is_number(p) for p in parts)
+
+
+def _stat_stamp(path: str):
+    """Return ``(mtime_ns, size)`` of a path, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _init_rc_tag(major: int, minor: int, patch: int):
+    """Format the first release candidate tag ("X.Y.Z-rc.1") of a version."""
+    return f"{major}.{minor}.{patch}-rc.1"
+
+
+def _parse_tag(tag: str):
+    """Split a version tag into its fields with plain str methods.
+
+    Args:
+        tag (str): A tag expected in the format "X.Y.Z" or "X.Y.Z-prerelease.N".
+
+    Returns:
+        tuple or None: ``(major, minor, patch, prerelease, number)`` with the
+                       numeric fields as ints (an empty prerelease and number 0
+                       for production versions), or None if the tag is malformed.
+    """
+    base, sep, prerelease = tag.partition("-")
+    parts = base.split(".")
+    if len(parts) != 3 or not all(_is_number(p) for p in parts):
+        return None
+    major, minor, patch = map(int, parts)
+    if not sep:
+        return major, minor, patch, "", 0
+    name, _, n = prerelease.rpartition(".")
+    if not (name and _is_number(n)):
+        return None
+    return major, minor, patch, name, int(n)
+
+
+@lru_cache(maxsize=4096)
+def _sortkey(tag: str):
+    """Build a plain tuple that orders tags by semantic version precedence.
+
+    Tuples compare natively, so ranking tags this way avoids constructing a
+    version object per tag. A production version sorts above every
+    prerelease of the same "X.Y.Z". Results are memoized, so each tag is
+    parsed once even when the tag set is scanned again after a change.
+
+    Args:
+        tag (str): A tag in the format "X.Y.Z" or "X.Y.Z-prerelease.N".
+
+    Returns:
+        tuple: ``(major, minor, patch, is_production, prerelease, number)``.
+
+    Raises:
+        ValueError: If the tag is in neither format.
+    """
+    parts = _parse_tag(tag)
+    if parts is None:
+        raise ValueError(f"{tag} is not a valid version tag")
+    major, minor, patch, name, n = parts
+    return major, minor, patch, int(not name), name, n
+
+
+def _parse_prerelease(tag: str):
+    """Parse a prerelease tag whose identifier consists of lowercase letters only.
+
+    Args:
+        tag (str): A tag expected in the format "X.Y.Z-prerelease.N".
+
+    Returns:
+        tuple or None: ``(major, minor, patch, prerelease, number)`` as returned
+                       by ``_parse_tag``, or None if the tag is malformed.
+    """
+    parts = _parse_tag(tag)
+    if parts is None:
+        return None
+    name = parts[3]
+    if not (name.isascii() and name.isalpha() and name.islower()):
+        return None
+    return parts
+
 
 class VersionControlManager:
     """A manager class for handling Git tags with semantic versioning.
@@ -16,16 +122,170 @@ class VersionControlManager:
         """Initialize the VersionControlManager with a repository path.
 
         If the repository doesn't exist at the given path, it will be created
-        and initialized as a new Git repository.
+        and initialized as a new Git repository. An existing directory that is
+        not a Git repository yet is initialized in place.
 
         Args:
             repo_path (str): The file system path to the Git repository.
         """
-        if not os.path.isdir(repo_path):
-            os.mkdir(repo_path)
-            self.repo = Repo.init(repo_path)
-        else:
+        os.makedirs(repo_path, exist_ok=True)
+        try:
             self.repo = Repo(repo_path)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            self.repo = Repo.init(repo_path)
+        self._tags = None
+        self._tags_stamp = None
+        self._latest = None
+
+
+    def _refs_stamp(self):
+        """Return a cheap fingerprint of the repository's tag refs.
+
+        Loose tags live in ``refs/tags`` and its subdirectories, packed tags in
+        ``packed-refs`` and, with the reftable backend, every ref in the tables
+        listed by ``reftable/tables.list``. Creating, moving or deleting a
+        loose tag changes the directory that holds it, so stat-ing every
+        directory under ``refs/tags`` plus those two files is enough to notice
+        tags changed outside of this manager without listing the refs again.
+
+        Returns:
+            dict: Maps each inspected path to its ``(mtime_ns, size)`` pair, or
+                  None for a missing path.
+        """
+        common_dir = self.repo.common_dir
+        stamp = {
+            path: _stat_stamp(path)
+            for path in (
+                os.path.join(common_dir, "packed-refs"),
+                os.path.join(common_dir, "reftable", "tables.list"),
+            )
+        }
+        dirs = [os.path.join(common_dir, "refs", "tags")]
+        while dirs:
+            path = dirs.pop()
+            stamp[path] = _stat_stamp(path)
+            try:
+                with os.scandir(path) as entries:
+                    dirs.extend(e.path for e in entries if e.is_dir(follow_symlinks=False))
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        return stamp
+
+
+    @property
+    def _tag_names(self):
+        """set: Names of all tags in the repository.
+
+        The set is built on first use and reused until the tag refs change
+        on disk. It is filled from a single ``git for-each-ref`` call rather
+        than by building a GitPython ``TagReference`` for every tag. Names are
+        interned so managers sharing tags don't keep duplicate strings. A reload
+        also drops the cached highest tag per kind.
+        """
+        stamp = self._refs_stamp()
+        if self._tags is None or stamp != self._tags_stamp:
+            out = self.repo.git.for_each_ref("--format=%(refname:strip=2)", "refs/tags/")
+            self._tags = {sys.intern(t) for t in out.splitlines()}
+            self._tags_stamp = stamp
+            self._latest = None
+        return self._tags
+
+
+    @property
+    def _latest_tags(self):
+        """dict: The highest tag of every kind, as built by ``find_latest_by_kind``.
+
+        Maps each prerelease identifier (``""`` for production versions) to a
+        ``(sortkey, tag)`` pair. Computed in one pass over the tag set and kept
+        until the tag refs change on disk; tags created by the manager update it
+        in place.
+        """
+        tag_names = self._tag_names
+        if self._latest is None:
+            latest = {}
+            for tag in tag_names:
+                try:
+                    key = _sortkey(tag)
+                except ValueError:
+                    continue
+                best = latest.get(key[4])
+                if best is None or key > best[0]:
+                    latest[key[4]] = (key, tag)
+            self._latest = latest
+        return self._latest
+
+
+    def _create_tag(self, tag, **kwargs):
+        """Create a tag and record it in the cached tag set.
+
+        Args:
+            tag: The tag name to create.
+            **kwargs: Forwarded to ``Repo.create_tag`` (e.g. ``ref``, ``message``).
+        """
+        stamp = self._refs_stamp()
+        self.repo.create_tag(tag, **kwargs)
+        self._record_tags([str(tag)], stamp)
+
+
+    def _bulk_create_tags(self, specs):
+        """Create several lightweight tags in a single ``git update-ref`` transaction.
+
+        All refs are written by one git process, and either every tag is
+        created or none is. The commands reach ``git update-ref`` through
+        GitPython via a temporary file, since ``istream`` is handed to the
+        process as its stdin.
+
+        Args:
+            specs (list): ``(tag, sha)`` pairs naming each tag and the object it
+                          should point to.
+
+        Raises:
+            ValueError: If a tag name is empty or contains whitespace.
+            GitCommandError: If git rejects the transaction, e.g. because one
+                             of the tags already exists.
+        """
+        for tag, _ in specs:
+            if tag.split() != [tag] or "\0" in tag:
+                raise ValueError(f"Invalid tag name: {tag!r}")
+
+        stamp = self._refs_stamp()
+        with tempfile.TemporaryFile() as commands:
+            commands.write("".join(f"create refs/tags/{tag} {sha}\n" for tag, sha in specs).encode())
+            commands.seek(0)
+            self.repo.git.update_ref("--stdin", istream=commands)
+
+        self._record_tags([tag for tag, _ in specs], stamp)
+
+
+    def _record_tags(self, tags, stamp):
+        """Add newly created tags to the cached tag set and per-kind index.
+
+        The highest tag of each kind is updated in place by comparing sort
+        keys, so creating a tag never forces a rescan of every tag. If the tag
+        refs had already changed on disk before the write, the cache is stale
+        and is dropped instead, so the next query reloads it.
+
+        Args:
+            tags (list): Names of the tags that were just created.
+            stamp (dict): ``_refs_stamp()`` taken right before the write.
+        """
+        if self._tags is None:
+            return
+        if stamp != self._tags_stamp:
+            self._tags = self._latest = None
+            return
+        self._tags.update(sys.intern(tag) for tag in tags)
+        self._tags_stamp = self._refs_stamp()
+        if self._latest is None:
+            return
+        for tag in tags:
+            try:
+                key = _sortkey(tag)
+            except ValueError:
+                continue
+            best = self._latest.get(key[4])
+            if best is None or key > best[0]:
+                self._latest[key[4]] = (key, sys.intern(tag))
 
 
     @staticmethod
@@ -36,7 +296,7 @@ class VersionControlManager:
         an initial release candidate tag (e.g., "1.2.3-rc.1").
 
         Args:
-            tag (str): A prerelease tag in the format "X.Y.Z-prerelease.N"
+            tag (str): A prerelease tag in the format "X.Y.Z-prerelease.N".
 
         Returns:
             str: The corresponding initial RC tag in format "X.Y.Z-rc.1"
@@ -44,12 +304,11 @@ class VersionControlManager:
         Raises:
             ValueError: If the tag doesn't match the expected prerelease pattern.
         """
-        pattern = r"^(\d+)\.(\d+)\.(\d+)-([a-z]+)\.(\d+)$"
-        if not re.fullmatch(pattern, tag):
+        parts = _parse_prerelease(tag)
+        if parts is None:
             raise ValueError
 
-        current_tag = semver.VersionInfo.parse(tag)
-        return f"{current_tag.major}.{current_tag.minor}.{current_tag.patch}-rc.1"
+        return _init_rc_tag(*parts[:3])
 
 
     def find_tag(self, tag: str):
@@ -64,26 +323,57 @@ class VersionControlManager:
         Returns:
             bool: True if the tag exists, False otherwise.
         """
-        pattern = r"^" + tag + r"$"
-        return any(re.search(pattern,t.name.strip()) for t in self.repo.tags)
+        return tag in self._tag_names
 
 
-    def find_tag_with_pattern(self, pattern: str):
+    def find_tag_with_pattern(self, pattern):
         """Find the highest semantic version tag matching a regex pattern.
 
         Searches through all repository tags for those matching the given regex pattern,
         then returns the highest version according to semantic versioning rules.
+        The tags are scanned in a single pass; no sorted list is built.
+
+        The pattern must match the whole tag name (``re.fullmatch``); a pattern
+        matching only part of a tag, such as ``r"dev"``, no longer finds it.
+        Matching tags that are not in the "X.Y.Z" or "X.Y.Z-prerelease.N" format
+        (e.g. "1.0.0-beta" or "1.0.0+build") can't be ranked and are skipped.
 
         Args:
-            pattern (str): Regular expression pattern to match against tag names.
+            pattern (str or re.Pattern): Regular expression pattern (or an already
+                                         compiled pattern) that must match the whole
+                                         tag name. ``^``/``$`` anchors are optional.
 
         Returns:
             str or None: The highest semantic version tag matching the pattern,
-                        or None if no matching tags are found.
+                        or None if no matching version tags are found.
         """
-        tags = [tag.name.strip() for tag in self.repo.tags if re.search(pattern, tag.name)]
-        sorted_tags = sorted(tags, key=semver.VersionInfo.parse, reverse=True)
-        return sorted_tags[0] if sorted_tags else None
+        pattern = _compile(pattern)
+        best = None
+        for tag in self._tag_names:
+            if not pattern.fullmatch(tag):
+                continue
+            try:
+                key = _sortkey(tag)
+            except ValueError:
+                continue
+            if best is None or key > best[0]:
+                best = (key, tag)
+        return best[1] if best else None
+
+
+    def find_latest_by_kind(self):
+        """Find the highest tag of every kind in a single pass over the tags.
+
+        Classifies each tag as a production version (X.Y.Z) or by its prerelease
+        identifier (X.Y.Z-prerelease.N) and keeps the highest semantic version
+        per kind, so callers interested in several kinds don't need one scan each.
+
+        Returns:
+            dict: Maps each prerelease identifier (e.g. "dev", "rc", "patch") to its
+                  highest tag, with production versions under the empty string "".
+                  Tags in neither format are ignored.
+        """
+        return {kind: tag for kind, (_, tag) in self._latest_tags.items()}
 
 
     def get_current_tag(self, prerelease_tag: str="dev", production: bool= False):
@@ -102,11 +392,14 @@ class VersionControlManager:
             str or None: The highest matching tag, or None if no matching tags exist.
         """
         if production:
-            dev_pattern = r"^(\d+)\.(\d+)\.(\d+)$"
+            kind = ""
+        elif prerelease_tag:
+            kind = prerelease_tag
         else:
-            dev_pattern = r"^(\d+)\.(\d+)\.(\d+)-" + prerelease_tag + r"\.(\d+)$"
+            return None
 
-        return self.find_tag_with_pattern(dev_pattern)
+        latest = self._latest_tags.get(kind)
+        return latest[1] if latest else None
 
 
     def increment_prerelease_tag(self, tag: str=None, prerelease_tag: str="dev", major_bump: bool= False):
@@ -128,21 +421,22 @@ class VersionControlManager:
         Raises:
             ValueError: If the provided tag doesn't match the expected prerelease pattern.
         """
-        pattern = r"^(\d+)\.(\d+)\.(\d+)-([a-z]+)\.(\d+)$"
         if tag:
-            if not re.fullmatch(pattern,tag):
+            parts = _parse_prerelease(tag)
+            if parts is None:
                 raise ValueError
-            if self.find_tag(self.get_init_rc_tag(tag)):
+            major, minor, patch, name, n = parts
+            if _init_rc_tag(major, minor, patch) in self._tag_names:
                 if major_bump:
-                    next_tag = f"{semver.VersionInfo.parse(tag).bump_major()}-{prerelease_tag}.1"
+                    next_tag = f"{major + 1}.0.0-{prerelease_tag}.1"
                 else:
-                    next_tag = f"{semver.VersionInfo.parse(tag).bump_minor()}-{prerelease_tag}.1"
+                    next_tag = f"{major}.{minor + 1}.0-{prerelease_tag}.1"
             else:
-                next_tag = semver.VersionInfo.parse(tag).bump_prerelease()
+                next_tag = f"{major}.{minor}.{patch}-{name}.{n + 1}"
         else:
             next_tag = f"0.1.0-{prerelease_tag}.1"
 
-        self.repo.create_tag(next_tag)
+        self._create_tag(next_tag)
         return next_tag
 
 
@@ -162,11 +456,10 @@ class VersionControlManager:
         """
         current_dev_tag = self.get_current_tag(prerelease_tag)
         if current_dev_tag:
-            t = semver.VersionInfo.parse(current_dev_tag)
-            init_release_tag = f"{t.major}.{t.minor}.{t.patch}-rc.1"
-            self.repo.create_tag(
+            init_release_tag = _init_rc_tag(*_sortkey(current_dev_tag)[:3])
+            self._create_tag(
                 init_release_tag,
-                ref=self.repo.commit(current_dev_tag),
+                ref=f"{current_dev_tag}^{{commit}}",
                 message=(
                     f"Release candidate version: {init_release_tag} " 
                     f"created from Development version: {current_dev_tag}"
@@ -190,9 +483,9 @@ class VersionControlManager:
         current_prod = self.get_current_tag(production=True)
         if current_prod:
             init_patch_tag = f"{current_prod}-patch.1"
-            self.repo.create_tag(
+            self._create_tag(
                 init_patch_tag,
-                ref=self.repo.commit(current_prod),
+                ref=f"{current_prod}^{{commit}}",
                 message=(
                     f"Patch version: {init_patch_tag} " 
                     f"created from Production version: {current_prod}"
@@ -220,12 +513,15 @@ class VersionControlManager:
         Raises:
             ValueError: If the base tag doesn't match the production version pattern.
         """
-        pattern = r"^(\d+)\.(\d+)\.(\d+)$"
-        if not re.fullmatch(pattern, tag):
+        if not _is_prod(tag):
             raise ValueError
 
-        rc_pattern = r"^" + tag + r"-" + prerelease_tag + r"\.(\d+)$"
-        return self.find_tag_with_pattern(rc_pattern)
+        prefix = f"{tag}-{prerelease_tag}."
+        return max(
+            (t for t in self._tag_names if t.startswith(prefix) and _is_number(t[len(prefix):])),
+            key=_sortkey,
+            default=None,
+        )
 
 
     def increment_rc_patch(self, tag: str, prerelease_tag: str="rc"):
@@ -250,30 +546,33 @@ class VersionControlManager:
                               version doesn't exist, or when a patch already exists
                               in production.
         """
-        pattern = r"^(\d+)\.(\d+)\.(\d+)$"
-        if not re.fullmatch(pattern, tag):
+        if not _is_prod(tag):
             raise ValueError
 
-        if  prerelease_tag == "rc" and self.find_tag(tag):
+        tag_names = self._tag_names
+        in_production = tag in tag_names
+        if  prerelease_tag == "rc" and in_production:
             raise InvalidTagCreation(
                 "Production version available. Cannot create Release Candidate version!"
             )
-        elif prerelease_tag == "patch" and not self.find_tag(tag):
+        elif prerelease_tag == "patch" and not in_production:
             raise InvalidTagCreation(
                 "Production version not available. Cannot create Patch version!"
             )
         elif prerelease_tag == "rc":
             current_rc = self.get_current_rc_patch(tag)
         elif prerelease_tag == "patch":
-            if self.find_tag(str(semver.VersionInfo.parse(tag).bump_patch())):
+            major, minor, patch = map(int, tag.split("."))
+            if f"{major}.{minor}.{patch + 1}" in tag_names:
                 raise InvalidTagCreation(
                     "Cannot increment Patch pre-release version. Patch found in Production."
                 )
             current_rc = self.get_current_rc_patch(tag, "patch")
 
         if current_rc:
-            new_rc_tag = semver.VersionInfo.parse(current_rc).bump_prerelease()
-            self.repo.create_tag(new_rc_tag)
+            prefix, _, n = current_rc.rpartition(".")
+            new_rc_tag = f"{prefix}.{int(n) + 1}"
+            self._create_tag(new_rc_tag)
             return new_rc_tag
 
         return None
@@ -296,22 +595,49 @@ class VersionControlManager:
         Raises:
             ValueError: If the tag doesn't match the expected RC or patch pattern.
         """
-        pattern = r"^(\d+)\.(\d+)\.(\d+)-(rc|patch)\.(\d+)$"
-        if not re.fullmatch(pattern, tag):
+        parts = _parse_prerelease(tag)
+        if parts is None:
             raise ValueError
 
-        if re.match(pattern,tag).group(4) == "patch":
-            new_prod_tag = semver.VersionInfo.parse(tag).bump_patch()
+        major, minor, patch, kind, _ = parts
+        if kind == "patch":
+            new_prod_tag = f"{major}.{minor}.{patch + 1}"
+        elif kind == "rc":
+            new_prod_tag = f"{major}.{minor}.{patch}"
         else:
-            t = semver.VersionInfo.parse(tag)
-            new_prod_tag = f"{t.major}.{t.minor}.{t.patch}"
+            raise ValueError
 
-        self.repo.create_tag(
+        self._create_tag(
             new_prod_tag,
-            ref=self.repo.commit(tag),
+            ref=f"{tag}^{{commit}}",
             message=(
                 f"Production version: {new_prod_tag} "
                 f"created from (Release Candidate | Patch) version: {tag}"
             )
         )
         return new_prod_tag
+
+
+    def create_tags(self, tags: list, ref: str="HEAD"):
+        """Create several lightweight tags pointing at the same commit.
+
+        Intended for scripted workflows that need many tags at once; the tags
+        are written in one git invocation instead of one per tag. No version
+        rules are checked.
+
+        Args:
+            tags (list): The tag names to create.
+            ref (str, optional): The commit (or any ref resolving to one) the tags
+                                 should point to. Defaults to "HEAD".
+
+        Returns:
+            list: The names of the created tags.
+
+        Raises:
+            ValueError: If a tag name is empty or contains whitespace.
+            GitCommandError: If any of the tags already exists; no tag is created then.
+        """
+        tags = list(tags)
+        sha = self.repo.commit(ref).hexsha
+        self._bulk_create_tags([(tag, sha) for tag in tags])
+        return tags
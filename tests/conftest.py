@@ -0,0 +1,58 @@
+"""
+Shared pytest fixtures for the VersionControlManager test suite.
+
+Every test runs against its own real Git repository, created under pytest's
+temporary directory (see ``--basetemp``). Tests do not share repository state,
+so they can run in any order or in parallel (``pytest -n auto``), and no
+directory has to exist before the run or is left in the working tree afterwards.
+"""
+
+from src.vcm import VersionControlManager
+import git, shutil, pytest
+
+
+@pytest.fixture(scope="session")
+def repo_template(tmp_path_factory):
+    """Initialize the empty repository every test repository is copied from.
+
+    The repository is initialized once per session (per worker under
+    pytest-xdist) without hook samples and with ``core.fsync=none``, so that
+    the many small commits and tags written by the tests are never synced
+    to disk. A local user identity is configured so the manager's annotated
+    tags can be created without any global git configuration.
+
+    Returns:
+        pathlib.Path: The path of the template repository.
+    """
+    path = tmp_path_factory.mktemp("vcm_template")
+    repo = git.Repo.init(path, template="")
+    with repo.config_writer() as config:
+        config.set_value("core", "fsync", "none")
+        config.set_value("user", "name", "VCM Tests")
+        config.set_value("user", "email", "vcm@example.com")
+    return path
+
+
+@pytest.fixture
+def repo_dir(repo_template, tmp_path):
+    """Create a fresh test repository for a single test.
+
+    The repository is a plain file copy of ``repo_template``, so no git
+    process is started to set it up.
+
+    Returns:
+        str: The path of the freshly copied repository.
+    """
+    path = tmp_path / "repo"
+    shutil.copytree(repo_template, path)
+    return str(path)
+
+
+@pytest.fixture
+def manager(repo_dir):
+    """Provide a VersionControlManager bound to the test's own repository.
+
+    Returns:
+        VersionControlManager: The manager bound to ``repo_dir``.
+    """
+    return VersionControlManager(repo_dir)